@@ -2,4 +2,17 @@ import os
 
 bind = "0.0.0.0:" + os.environ.get("PORT", "10000")
 workers = 2
+# DB や Cloudinary の待ち時間中も他のリクエストを処理できるようスレッドで並行化する
+# (psycopg2 は I/O 中に GIL を解放する。スレッド数は DB プールの pool_size 以下に抑える)
+worker_class = "gthread"
+threads = 8
 accesslog = "-"
+# アプリを master で一度だけ import し、テンプレートやモジュールを fork 後のワーカーで共有する
+preload_app = True
+
+
+def post_fork(server, worker):
+    # master が import 時 (create_all) に開いた接続を子プロセスで使い回さないよう、プールを張り直す
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)